@@ -812,13 +812,13 @@ class MiscCourseTests(ContentStoreTestCase):
         num_drafts = self._get_draft_counts(course)
         self.assertEqual(num_drafts, 1)
 
-    @mock.patch('xmodule.course_block.requests.get')
+    @mock.patch('xmodule.course_block._toc_session.get')
     def test_import_textbook_as_content_element(self, mock_get):
-        mock_get.return_value.text = dedent("""
+        mock_get.return_value.content = dedent("""
             <?xml version="1.0"?><table_of_contents>
             <entry page="5" page_label="ii" name="Table of Contents"/>
             </table_of_contents>
-        """).strip()
+        """).strip().encode('utf-8')
         self.course.textbooks = [Textbook("Textbook", "https://s3.amazonaws.com/edx-textbooks/guttag_computation_v3/")]
         course = self.store.update_item(self.course, self.user.id)
         self.assertGreater(len(course.textbooks), 0)
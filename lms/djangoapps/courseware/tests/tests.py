@@ -124,13 +124,13 @@ class TestMongoCoursesLoad(ModuleStoreTestCase, PageLoaderTestCase):
         self.setup_user()
         self.toy_course_key = ToyCourseFactory.create().id
 
-    @mock.patch('xmodule.course_block.requests.get')
+    @mock.patch('xmodule.course_block._toc_session.get')
     def test_toy_textbooks_loads(self, mock_get):
-        mock_get.return_value.text = dedent("""
+        mock_get.return_value.content = dedent("""
             <?xml version="1.0"?><table_of_contents>
             <entry page="5" page_label="ii" name="Table of Contents"/>
             </table_of_contents>
-        """).strip()
+        """).strip().encode('utf-8')
         location = self.toy_course_key.make_usage_key('course', 'course')
         course = self.store.get_item(location)
         assert len(course.textbooks) > 0
@@ -62,23 +62,20 @@ def grading_context(course, course_structure):
                 filter_func=possibly_scored,
                 start_node=subsection.location,
         ):
-            scored_descendants_of_subsection.append(
-                course_structure[descendant_key],
-            )
+            count_all_graded_blocks += 1
+            descendant = course_structure[descendant_key]
+            # include only those blocks that have scores, not if they are just a parent
+            if getattr(descendant, 'has_score', None):
+                scored_descendants_of_subsection.append(descendant)
 
-        # include only those blocks that have scores, not if they are just a parent
         subsection_info = {
             'subsection_block': subsection,
-            'scored_descendants': [
-                child for child in scored_descendants_of_subsection
-                if getattr(child, 'has_score', None)
-            ]
+            'scored_descendants': scored_descendants_of_subsection,
         }
         subsection_format = getattr(subsection, 'format', '')
         if subsection_format not in all_graded_subsections_by_type:
             all_graded_subsections_by_type[subsection_format] = []
         all_graded_subsections_by_type[subsection_format].append(subsection_info)
-        count_all_graded_blocks += len(scored_descendants_of_subsection)
 
     return {
         'all_graded_subsections_by_type': all_graded_subsections_by_type,
@@ -489,15 +489,18 @@ def dump_grading_context(course):
     msg = hbar
     msg += "Course grader:\n"
 
-    msg += '%s\n' % course.grader.__class__
+    course_grader = course.grader
+    msg += '%s\n' % course_grader.__class__
     graders = {}
-    if isinstance(course.grader, xmgraders.WeightedSubsectionsGrader):
+    # Graders may be shared between courses, so track assignment numbering here rather than on them.
+    grader_indexes = {}
+    if isinstance(course_grader, xmgraders.WeightedSubsectionsGrader):
         msg += '\n'
         msg += "Graded sections:\n"
-        for subgrader, category, weight in course.grader.subgraders:
+        for subgrader, category, weight in course_grader.subgraders:
             msg += "  subgrader=%s, type=%s, category=%s, weight=%s\n"\
                 % (subgrader.__class__, subgrader.type, category, weight)
-            subgrader.index = 1
+            grader_indexes[subgrader.type] = 1
             graders[subgrader.type] = subgrader
     msg += hbar
     msg += "Listing grading context for course %s\n" % str(course.id)
@@ -514,8 +517,8 @@ def dump_grading_context(course):
             aname = ''
             if frmat in graders:
                 gform = graders[frmat]
-                aname = '%s %02d' % (gform.short_label, gform.index)
-                gform.index += 1
+                aname = '%s %02d' % (gform.short_label, grader_indexes[frmat])
+                grader_indexes[frmat] += 1
             elif sdesc.display_name in graders:
                 gform = graders[sdesc.display_name]
                 aname = '%s' % gform.short_label
@@ -7,7 +7,6 @@ import textwrap
 from unittest import mock
 
 import pytest
-import requests
 from django.urls import NoReverseMatch, reverse
 
 from common.djangoapps.student.tests.factories import CourseEnrollmentFactory, UserFactory
@@ -81,8 +80,8 @@ class StaticImageBookTest(StaticBookTest):
 
     def test_book(self):
         # We can access a book.
-        with mock.patch.object(requests, 'get') as mock_get:
-            mock_get.return_value.text = textwrap.dedent('''\
+        with mock.patch('xmodule.course_block._toc_session.get') as mock_get:
+            mock_get.return_value.content = textwrap.dedent('''\
                 <?xml version="1.0"?>
                 <table_of_contents>
                 <entry page="9" page_label="ix" name="Contents!?"/>
@@ -90,7 +89,7 @@ class StaticImageBookTest(StaticBookTest):
                     <entry page="4" page_label="iv" name="About the Elephants"/>
                 </entry>
                 </table_of_contents>
-                ''')
+                ''').encode('utf-8')
 
             self.make_course(textbooks=[IMAGE_BOOK])
             url = self.make_url('book', book_index=0)
@@ -2,14 +2,17 @@
 Field Descriptions
 """
 import logging
+from functools import lru_cache
+
 from django import forms
 from django.conf import settings
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
 
 from common.djangoapps.student.models import UserProfile
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
 from openedx.core.djangoapps.user_api import accounts
 from openedx.core.djangoapps.user_authn.api.constants import SUPPORTED_FIELDS_TYPES
+from openedx.core.lib.cache_utils import request_cached
 
 log = logging.getLogger(__name__)
 
@@ -23,6 +26,20 @@ FIELD_TYPE_MAP = {
     forms.EmailField: "email",
 }
 
+_SELECT = SUPPORTED_FIELDS_TYPES['SELECT']
+_TEXT = SUPPORTED_FIELDS_TYPES['TEXT']
+_TEXTAREA = SUPPORTED_FIELDS_TYPES['TEXTAREA']
+
+YEAR_OF_BIRTH_OPTIONS = tuple((str(year), str(year)) for year in UserProfile.VALID_YEARS)
+
+
+@lru_cache(maxsize=None)
+def _get_serialization_options(form_class):
+    """
+    Returns the serialization options declared on an extension form class's Meta
+    """
+    return getattr(getattr(form_class, 'Meta', None), 'serialization_options', {})
+
 
 def add_extension_form_field(field_name, custom_form, field_description, field_type):
     """
@@ -30,15 +47,15 @@ def add_extension_form_field(field_name, custom_form, field_description, field_t
     """
     restrictions = {}
     if field_type == 'required':
-        if getattr(field_description, 'max_length', None):
-            restrictions['max_length'] = field_description.max_length
-        if getattr(field_description, 'min_length', None):
-            restrictions['min_length'] = field_description.min_length
+        max_length = getattr(field_description, 'max_length', None)
+        if max_length:
+            restrictions['max_length'] = max_length
+        min_length = getattr(field_description, 'min_length', None)
+        if min_length:
+            restrictions['min_length'] = min_length
 
-    field_options = getattr(
-        getattr(custom_form, 'Meta', None), 'serialization_options', {}
-    ).get(field_name, {})
-    custom_field_type = field_options.get('field_type', FIELD_TYPE_MAP.get(field_description.__class__))
+    field_options = _get_serialization_options(type(custom_form)).get(field_name, {})
+    custom_field_type = field_options.get('field_type', FIELD_TYPE_MAP.get(type(field_description)))
 
     if not custom_field_type:
         log.info(
@@ -58,6 +75,30 @@ def add_extension_form_field(field_name, custom_form, field_description, field_t
     }
 
 
+@request_cached()
+def _get_extra_field_options():
+    """
+    Returns the EXTRA_FIELD_OPTIONS site configuration, looked up once per request
+    """
+    return configuration_helpers.get_value('EXTRA_FIELD_OPTIONS')
+
+
+@request_cached()
+def _get_platform_name():
+    """
+    Returns the platform name for the current site, looked up once per request
+    """
+    return configuration_helpers.get_value("PLATFORM_NAME", settings.PLATFORM_NAME)
+
+
+@lru_cache(maxsize=64)
+def _get_select_options(field_options):
+    """
+    Returns the select options for a tuple of configured EXTRA_FIELD_OPTIONS values
+    """
+    return tuple((str(option.lower()), option) for option in field_options)
+
+
 def _add_field_with_configurable_select_options(field_name, field_label, is_field_required=False, error_message=''):
     """
     Returns a field description
@@ -69,22 +110,56 @@ def _add_field_with_configurable_select_options(field_name, field_label, is_fiel
         'label': field_label,
         'error_message': error_message if is_field_required else '',
     }
-    extra_field_options = configuration_helpers.get_value('EXTRA_FIELD_OPTIONS')
+    extra_field_options = _get_extra_field_options()
     if extra_field_options is None or extra_field_options.get(field_name) is None:
         field_attributes.update({
-            'type': SUPPORTED_FIELDS_TYPES['TEXT'],
+            'type': _TEXT,
         })
     else:
         field_options = extra_field_options.get(field_name)
-        options = [(str(option.lower()), option) for option in field_options]
         field_attributes.update({
-            'type': SUPPORTED_FIELDS_TYPES['SELECT'],
-            'options': options
+            'type': _SELECT,
+            'options': list(_get_select_options(tuple(field_options)))
         })
 
     return field_attributes
 
 
+@lru_cache(maxsize=32)
+def _get_level_of_education_options(language, is_coppa_compliant):  # pylint: disable=unused-argument
+    """
+    Returns the translated level of education options for the active language.
+
+    The language is only part of the cache key; gettext picks up the active language itself.
+    """
+    # pylint: disable=translation-of-non-string
+    return tuple(
+        (name, _(label)) for name, label in UserProfile.LEVEL_OF_EDUCATION_CHOICES
+        if not (is_coppa_compliant and name == 'el')
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_gender_options(language):  # pylint: disable=unused-argument
+    """
+    Returns the translated gender options for the active language.
+    """
+    # pylint: disable=translation-of-non-string
+    return tuple((name, _(label)) for name, label in UserProfile.GENDER_CHOICES)
+
+
+def _simple_field_description(field_name, field_type, label, error_message, is_field_required):
+    """
+    Returns the description of a field that has no options
+    """
+    return {
+        'name': field_name,
+        'type': field_type,
+        'label': label,
+        'error_message': error_message if is_field_required else '',
+    }
+
+
 def add_level_of_education_field(is_field_required=False):
     """
     Returns the level of education field description
@@ -93,18 +168,14 @@ def add_level_of_education_field(is_field_required=False):
     # the user's highest completed level of education.
     education_level_label = _("Highest level of education completed")
 
-    # pylint: disable=translation-of-non-string
-    options = [(name, _(label)) for name, label in UserProfile.LEVEL_OF_EDUCATION_CHOICES]
-
-    if settings.ENABLE_COPPA_COMPLIANCE:
-        options = list(filter(lambda op: op[0] != 'el', options))
+    options = _get_level_of_education_options(get_language(), settings.ENABLE_COPPA_COMPLIANCE)
 
     return {
         'name': 'level_of_education',
-        'type': SUPPORTED_FIELDS_TYPES['SELECT'],
+        'type': _SELECT,
         'label': education_level_label,
         'error_message': accounts.REQUIRED_FIELD_LEVEL_OF_EDUCATION_MSG if is_field_required else '',
-        'options': options,
+        'options': list(options),
     }
 
 
@@ -116,14 +187,12 @@ def add_gender_field(is_field_required=False):
     # the user's gender.
     gender_label = _("Gender")
 
-    # pylint: disable=translation-of-non-string
-    options = [(name, _(label)) for name, label in UserProfile.GENDER_CHOICES]
     return {
         'name': 'gender',
-        'type': SUPPORTED_FIELDS_TYPES['SELECT'],
+        'type': _SELECT,
         'label': gender_label,
         'error_message': accounts.REQUIRED_FIELD_GENDER_MSG if is_field_required else '',
-        'options': options,
+        'options': list(_get_gender_options(get_language())),
     }
 
 
@@ -135,13 +204,12 @@ def add_year_of_birth_field(is_field_required=False):
     # used to select the user's year of birth.
     year_of_birth_label = _("Year of birth")
 
-    options = [(str(year), str(year)) for year in UserProfile.VALID_YEARS]
     return {
         'name': 'year_of_birth',
-        'type': SUPPORTED_FIELDS_TYPES['SELECT'],
+        'type': _SELECT,
         'label': year_of_birth_label,
         'error_message': accounts.REQUIRED_FIELD_YEAR_OF_BIRTH_MSG if is_field_required else '',
-        'options': options,
+        'options': list(YEAR_OF_BIRTH_OPTIONS),
     }
 
 
@@ -152,15 +220,12 @@ def add_goals_field(is_field_required=False):
     # Translators: This phrase appears above a field meant to hold
     # the user's reasons for registering with edX.
     goals_label = _("Tell us why you're interested in {platform_name}").format(
-        platform_name=configuration_helpers.get_value("PLATFORM_NAME", settings.PLATFORM_NAME)
+        platform_name=_get_platform_name()
     )
 
-    return {
-        'name': 'goals',
-        'type': SUPPORTED_FIELDS_TYPES['TEXTAREA'],
-        'label': goals_label,
-        'error_message': accounts.REQUIRED_FIELD_GOALS_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'goals', _TEXTAREA, goals_label, accounts.REQUIRED_FIELD_GOALS_MSG, is_field_required,
+    )
 
 
 def add_profession_field(is_field_required=False):
@@ -225,12 +290,9 @@ def add_first_name_field(is_field_required=False):
     # user to input the First Name
     first_name_label = _("First Name")
 
-    return {
-        'name': 'first_name',
-        'type': SUPPORTED_FIELDS_TYPES['TEXT'],
-        'label': first_name_label,
-        'error_message': accounts.REQUIRED_FIELD_FIRST_NAME_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'first_name', _TEXT, first_name_label, accounts.REQUIRED_FIELD_FIRST_NAME_MSG, is_field_required,
+    )
 
 
 def add_last_name_field(is_field_required=False):
@@ -241,12 +303,9 @@ def add_last_name_field(is_field_required=False):
     # user to input the Last Name
     last_name_label = _("Last Name")
 
-    return {
-        'name': 'last_name',
-        'type': SUPPORTED_FIELDS_TYPES['TEXT'],
-        'label': last_name_label,
-        'error_message': accounts.REQUIRED_FIELD_LAST_NAME_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'last_name', _TEXT, last_name_label, accounts.REQUIRED_FIELD_LAST_NAME_MSG, is_field_required,
+    )
 
 
 def add_mailing_address_field(is_field_required=False):
@@ -257,12 +316,10 @@ def add_mailing_address_field(is_field_required=False):
     # meant to hold the user's mailing address.
     mailing_address_label = _("Mailing address")
 
-    return {
-        'name': 'mailing_address',
-        'type': SUPPORTED_FIELDS_TYPES['TEXTAREA'],
-        'label': mailing_address_label,
-        'error_message': accounts.REQUIRED_FIELD_MAILING_ADDRESS_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'mailing_address', _TEXTAREA, mailing_address_label, accounts.REQUIRED_FIELD_MAILING_ADDRESS_MSG,
+        is_field_required,
+    )
 
 
 def add_state_field(is_field_required=False):
@@ -273,12 +330,9 @@ def add_state_field(is_field_required=False):
     # which allows the user to input the State/Province/Region in which they live.
     state_label = _("State/Province/Region")
 
-    return {
-        'name': 'state',
-        'type': SUPPORTED_FIELDS_TYPES['TEXT'],
-        'label': state_label,
-        'error_message': accounts.REQUIRED_FIELD_STATE_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'state', _TEXT, state_label, accounts.REQUIRED_FIELD_STATE_MSG, is_field_required,
+    )
 
 
 def add_city_field(is_field_required=False):
@@ -289,12 +343,9 @@ def add_city_field(is_field_required=False):
     # which allows the user to input the city in which they live.
     city_label = _("City")
 
-    return {
-        'name': 'city',
-        'type': SUPPORTED_FIELDS_TYPES['TEXT'],
-        'label': city_label,
-        'error_message': accounts.REQUIRED_FIELD_CITY_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'city', _TEXT, city_label, accounts.REQUIRED_FIELD_CITY_MSG, is_field_required,
+    )
 
 
 def add_honor_code_field(is_field_required=False):
@@ -311,16 +362,20 @@ def add_honor_code_field(is_field_required=False):
         separate_honor_and_tos = True
 
     terms_type = "honor_code" if separate_honor_and_tos else "tos_and_honor_code"
-    terms_label = "Honor Code" if separate_honor_and_tos else "Terms of Service and Honor Code"
-    platform_name = configuration_helpers.get_value("PLATFORM_NAME", settings.PLATFORM_NAME)
 
-    # Translators: "Terms of Service" is a legal document users must agree to
-    # in order to register a new account.
-    error_msg = f'You must agree to the {platform_name} {terms_label}' if separate_honor_and_tos else ''
+    error_msg = ''
+    if separate_honor_and_tos and is_field_required:
+        # Translators: "Terms of Service" is a legal document users must agree to
+        # in order to register a new account.
+        error_msg = _("You must agree to the {platform_name} {terms_of_service}").format(
+            platform_name=_get_platform_name(),
+            terms_of_service=_("Honor Code"),
+        )
+
     return {
         'name': 'honor_code',
         'type': terms_type,
-        'error_message': error_msg if is_field_required else '',
+        'error_message': error_msg,
     }
 
 
@@ -329,11 +384,13 @@ def add_terms_of_service_field(is_field_required=False):
     Returns terms of condition field description
     """
     terms_label = _("Terms of Service")
-    platform_name = configuration_helpers.get_value("PLATFORM_NAME", settings.PLATFORM_NAME)
 
     # Translators: "Terms of service" is a legal document users must agree to
     # in order to register a new account.
-    error_msg = f'You must agree to the {platform_name} {terms_label}'
+    error_msg = _("You must agree to the {platform_name} {terms_of_service}").format(
+        platform_name=_get_platform_name(),
+        terms_of_service=terms_label,
+    )
     return {
         'name': 'terms_of_service',
         'error_message': error_msg if is_field_required else '',
@@ -358,9 +415,29 @@ def add_confirm_email_field(is_field_required=False):
 
     email_label = _("Confirm Email")
 
-    return {
-        'name': 'confirm_email',
-        'type': SUPPORTED_FIELDS_TYPES['TEXT'],
-        'label': email_label,
-        'error_message': accounts.REQUIRED_FIELD_CONFIRM_EMAIL_TEXT_MSG if is_field_required else '',
-    }
+    return _simple_field_description(
+        'confirm_email', _TEXT, email_label, accounts.REQUIRED_FIELD_CONFIRM_EMAIL_TEXT_MSG, is_field_required,
+    )
+
+
+# Field description builders for the registration fields, keyed by field name
+FIELD_BUILDERS = {
+    'confirm_email': add_confirm_email_field,
+    'first_name': add_first_name_field,
+    'last_name': add_last_name_field,
+    'city': add_city_field,
+    'state': add_state_field,
+    'country': add_country_field,
+    'gender': add_gender_field,
+    'year_of_birth': add_year_of_birth_field,
+    'level_of_education': add_level_of_education_field,
+    'company': add_company_field,
+    'job_title': add_job_title_field,
+    'title': add_title_field,
+    'mailing_address': add_mailing_address_field,
+    'goals': add_goals_field,
+    'honor_code': add_honor_code_field,
+    'terms_of_service': add_terms_of_service_field,
+    'profession': add_profession_field,
+    'specialty': add_specialty_field,
+}
@@ -100,6 +100,9 @@ class RegistrationFieldsContext(APIView):
         """
         Returns the required or optional fields configured in REGISTRATION_EXTRA_FIELDS settings.
         """
+        if not self.valid_fields:
+            return {}
+
         # Custom form fields can be added via the form set in settings.REGISTRATION_EXTENSION_FORM
         custom_form = get_registration_extension_form() or {}
         response = {}
@@ -111,7 +114,7 @@ class RegistrationFieldsContext(APIView):
                     field, custom_form, custom_form.fields[field], self.field_type
                 )
             else:
-                field_handler = getattr(form_fields, f'add_{field}_field', None)
+                field_handler = form_fields.FIELD_BUILDERS.get(field)
                 if field_handler:
                     response[field] = field_handler(self.field_type == 'required')
 
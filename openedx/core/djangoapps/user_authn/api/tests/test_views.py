@@ -304,6 +304,24 @@ class MFEContextViewTest(ThirdPartyAuthTestMixin, APITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert response.data['optionalFields']['fields'] == expected_response
 
+    @ddt.data(True, False)
+    def test_level_of_education_options_follow_coppa_setting(self, enable_coppa_compliance):
+        """
+        Test that the cached level of education options are kept separate for COPPA
+        compliant and non-compliant configurations.
+        """
+        self.query_params.update({'is_register_page': True})
+        with override_settings(
+            ENABLE_DYNAMIC_REGISTRATION_FIELDS=True,
+            ENABLE_COPPA_COMPLIANCE=enable_coppa_compliance,
+            REGISTRATION_EXTRA_FIELDS={'level_of_education': 'optional'},
+        ):
+            response = self.client.get(self.url, self.query_params)
+
+        assert response.status_code == status.HTTP_200_OK
+        options = response.data['optionalFields']['fields']['level_of_education']['options']
+        assert ('el' in [name for name, _ in options]) is not enable_coppa_compliance
+
     @with_site_configuration(
         configuration={
             'extended_profile_fields': ['specialty']
@@ -437,3 +455,22 @@ class SendAccountActivationEmail(UserAPITestCase):
         self.user.save()
         self.client.post(self.path)
         assert email.called is True, 'method should have been called'
+
+    @patch('common.djangoapps.student.views.management.compose_activation_email')
+    def test_send_email_to_active_user(self, email):
+        """
+        Tests that no activation email is sent to a user who is already active.
+        """
+        response = self.client.post(self.path)
+        assert response.status_code == status.HTTP_200_OK
+        assert email.called is False, 'method should not have been called'
+
+    def test_send_email_to_inactive_user_without_profile(self):
+        """
+        Tests that a missing user profile is reported as a server error.
+        """
+        self.user.is_active = False
+        self.user.save()
+        self.user.profile.delete()
+        response = self.client.post(self.path)
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
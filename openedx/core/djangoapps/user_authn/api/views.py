@@ -1,8 +1,10 @@
 """
 Authn API Views
 """
+import logging
 
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
 
 from rest_framework import status
 from rest_framework.response import Response
@@ -18,6 +20,8 @@ from openedx.core.djangoapps.user_authn.api.helper import RegistrationFieldsCont
 from openedx.core.djangoapps.user_authn.serializers import MFEContextSerializer
 from openedx.core.djangoapps.user_authn.views.utils import get_mfe_context
 
+log = logging.getLogger(__name__)
+
 
 class MFEContextThrottle(AnonRateThrottle):
     """
@@ -128,14 +132,15 @@ class SendAccountActivationEmail(APIView):
         Arguments:
             request (HttpRequest): The request, used to get the user
         """
-        try:
-            user = request.user
-            if not user.is_active:
+        user = request.user
+        if not user.is_active:
+            try:
                 compose_and_send_activation_email(user, user.profile)
-            return Response(
-                status=status.HTTP_200_OK
-            )
-        except Exception:  # pylint: disable=broad-except
-            return Response(
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+            except ObjectDoesNotExist:
+                log.exception(f'Could not send account activation email to user {user.id}.')
+                return Response(
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+        return Response(
+            status=status.HTTP_200_OK
+        )
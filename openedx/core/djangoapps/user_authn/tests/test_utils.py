@@ -43,6 +43,10 @@ class TestRedirectUtils(TestCase):
 
         # Django's url_has_allowed_host_and_scheme protects against "///"
         RedirectCase('http:///edx.org/courses', 'edx.org', req_is_secure=True, expected_is_safe=False),
+
+        # Tabs and newlines are stripped before the host is checked
+        RedirectCase('/\t/www.amazon.org', 'edx.org', req_is_secure=True, expected_is_safe=False),
+        RedirectCase('https://test.\r\nedx.org/courses', 'edx.org', req_is_secure=True, expected_is_safe=True),
     )
     @ddt.unpack
     @override_settings(LOGIN_REDIRECT_WHITELIST=['test.edx.org'])
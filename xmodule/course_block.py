@@ -3,6 +3,10 @@ Django module container for classes and operations related to the "Course Block"
 """
 
 
+import bisect
+import copy
+import functools
+import itertools
 import json
 import logging
 from datetime import datetime, timedelta
@@ -11,11 +15,14 @@ import dateutil.parser
 import requests
 from django.conf import settings
 from django.core.validators import validate_email
+from edx_django_utils.cache import TieredCache, get_cache_key
 from edx_toggles.toggles import SettingDictToggle
 from lazy import lazy
 from lxml import etree
 from path import Path as path
 from pytz import utc
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from xblock.fields import Boolean, Dict, Float, Integer, List, Scope, String
 from openedx.core.djangoapps.video_pipeline.models import VideoUploadsEnabledByDefault
 from openedx.core.lib.license import LicenseMixin
@@ -75,6 +82,21 @@ CREATE_COURSE_WITH_DEFAULT_ENROLLMENT_START_DATE = SettingDictToggle(
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _grader_from_json(raw_grader_json):
+    """
+    Build a grader from a JSON-serialized grader configuration.
+
+    Graders hold no per-learner state, so courses with identical configurations
+    (most often the default policy) share one compiled grader.
+    """
+    return grader_from_conf(json.loads(raw_grader_json))
+
+
+# Most courses use the default grading policy, so build its grader once up front.
+_DEFAULT_GRADER = _grader_from_json(json.dumps(DEFAULT_GRADING_POLICY['GRADER'], sort_keys=True))
+
+
 class StringOrDate(Date):  # lint-amnesty, pylint: disable=missing-class-docstring
     def from_json(self, value):  # lint-amnesty, pylint: disable=arguments-differ
         """
@@ -119,7 +141,17 @@ class EmailString(String):
 edx_xml_parser = etree.XMLParser(dtd_validation=False, load_dtd=False,
                                  remove_comments=True, remove_blank_text=True)
 
-_cached_toc = {}
+# How long (in seconds) a fetched textbook table of contents is cached.
+TEXTBOOK_TOC_CACHE_TIMEOUT = 600
+# (connect, read) timeouts, in seconds, for fetching a textbook table of contents.
+TEXTBOOK_TOC_REQUEST_TIMEOUT = (3, 10)
+
+# Tables of contents are fetched through a shared session so that connections to the
+# textbook host (usually S3) are kept alive and reused instead of re-established per fetch.
+_toc_session = requests.Session()
+_toc_adapter = HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2))
+_toc_session.mount('http://', _toc_adapter)
+_toc_session.mount('https://', _toc_adapter)
 
 
 class Textbook:  # lint-amnesty, pylint: disable=missing-class-docstring
@@ -134,11 +166,9 @@ class Textbook:  # lint-amnesty, pylint: disable=missing-class-docstring
     @lazy
     def end_page(self):  # lint-amnesty, pylint: disable=missing-function-docstring
         # The last page should be the last element in the table of contents,
-        # but it may be nested. So recurse all the way down the last element
-        last_el = self.table_of_contents[-1]
-        while last_el.getchildren():
-            last_el = last_el[-1]
-
+        # but it may be nested. The bottom of the last branch is the last
+        # childless element in document order, so let libxml2 find it directly.
+        last_el = self.table_of_contents.xpath('(descendant::*[not(*)])[last()]')[0]
         return int(last_el.attrib['page'])
 
     @lazy
@@ -154,37 +184,34 @@ class Textbook:  # lint-amnesty, pylint: disable=missing-class-docstring
         # course blocks have a very short lifespan and are constantly being created and torn down.
         # Since this module in the __init__() method does a synchronous call to AWS to get the TOC
         # this is causing a big performance problem. So let's be a bit smarter about this and cache
-        # each fetch and store in-mem for 10 minutes.
-        # NOTE: I have to get this onto sandbox ASAP as we're having runtime failures. I'd like to swing back and
-        # rewrite to use the traditional Django in-memory cache.
-        try:
-            # see if we already fetched this
-            if toc_url in _cached_toc:
-                (table_of_contents, timestamp) = _cached_toc[toc_url]
-                age = datetime.now(utc) - timestamp
-                # expire every 10 minutes
-                if age.seconds < 600:
-                    return table_of_contents
-        except Exception as err:  # lint-amnesty, pylint: disable=broad-except, unused-variable
-            pass
+        # each fetch for 10 minutes. The raw XML is kept in the Django cache (which bounds its own
+        # size and evicts expired entries) rather than in an ever-growing module-level dict.
+        cache_key = get_cache_key(type='textbook_toc', url=toc_url)
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return etree.fromstring(cached_response.value, parser=edx_xml_parser)
 
         # Get the table of contents from S3
         log.info("Retrieving textbook table of contents from %s", toc_url)
         try:
-            r = requests.get(toc_url)
+            r = _toc_session.get(toc_url, timeout=TEXTBOOK_TOC_REQUEST_TIMEOUT)
+            r.raise_for_status()
         except Exception as err:
             msg = f'Error {err}: Unable to retrieve textbook table of contents at {toc_url}'
             log.error(msg)
             raise Exception(msg)  # lint-amnesty, pylint: disable=raise-missing-from
 
-        # TOC is XML. Parse it
+        # TOC is XML. Parse the raw bytes so that lxml handles decoding itself
         try:
-            table_of_contents = etree.fromstring(r.text)
+            table_of_contents = etree.fromstring(r.content, parser=edx_xml_parser)
         except Exception as err:
             msg = f'Error {err}: Unable to parse XML for textbook table of contents at {toc_url}'
             log.error(msg)
             raise Exception(msg)  # lint-amnesty, pylint: disable=raise-missing-from
 
+        # Only cache tables of contents that parsed successfully.
+        TieredCache.set_all_tiers(cache_key, r.content, TEXTBOOK_TOC_CACHE_TIMEOUT)
+
         return table_of_contents
 
     def __eq__(self, other):
@@ -1078,6 +1105,8 @@ class CourseBlock(
         _ = self.runtime.service(self, "i18n").ugettext
 
         self._gating_prerequisites = None
+        # (raw discussion_blackouts value, what _get_parsed_discussion_blackouts made of it)
+        self._parsed_discussion_blackouts = None
 
         if self.wiki_slug is None:
             self.wiki_slug = self.location.course
@@ -1127,10 +1156,12 @@ class CourseBlock(
         grading_policy = self.grading_policy
         # BOY DO I HATE THIS grading_policy CODE ACROBATICS YET HERE I ADD MORE (dhm)--this fixes things persisted w/
         # defective grading policy values (but not None)
+        # Reading CourseFields.grading_policy.default deep-copies the entire default policy, so only copy
+        # the missing piece.
         if 'GRADER' not in grading_policy:
-            grading_policy['GRADER'] = CourseFields.grading_policy.default['GRADER']
+            grading_policy['GRADER'] = copy.deepcopy(DEFAULT_GRADING_POLICY['GRADER'])
         if 'GRADE_CUTOFFS' not in grading_policy:
-            grading_policy['GRADE_CUTOFFS'] = CourseFields.grading_policy.default['GRADE_CUTOFFS']
+            grading_policy['GRADE_CUTOFFS'] = copy.deepcopy(DEFAULT_GRADING_POLICY['GRADE_CUTOFFS'])
 
         # Override any global settings with the course settings
         grading_policy.update(course_policy)
@@ -1192,17 +1223,19 @@ class CourseBlock(
 
     @classmethod
     def definition_from_xml(cls, xml_object, system):
+        # Pull out the textbook tags and the (first) wiki tag in a single pass over the children
         textbooks = []
-        for textbook in xml_object.findall("textbook"):
-            textbooks.append((textbook.get('title'), textbook.get('book_url')))
-            xml_object.remove(textbook)
-
-        # Load the wiki tag if it exists
         wiki_slug = None
-        wiki_tag = xml_object.find("wiki")
-        if wiki_tag is not None:
-            wiki_slug = wiki_tag.attrib.get("slug", default=None)
-            xml_object.remove(wiki_tag)
+        wiki_tag = None
+        for element in xml_object.xpath("textbook|wiki"):
+            if element.tag == "textbook":
+                textbooks.append((element.get('title'), element.get('book_url')))
+            elif wiki_tag is None:
+                wiki_tag = element
+                wiki_slug = element.get("slug")
+            else:
+                continue
+            xml_object.remove(element)
 
         definition, children = super().definition_from_xml(xml_object, system)
         definition['textbooks'] = textbooks
@@ -1253,7 +1286,15 @@ class CourseBlock(
 
     @property
     def grader(self):
-        return grader_from_conf(self.raw_grader)
+        raw_grader = self.raw_grader
+        if raw_grader == DEFAULT_GRADING_POLICY['GRADER']:
+            return _DEFAULT_GRADER
+        try:
+            raw_grader_json = json.dumps(raw_grader, sort_keys=True)
+        except TypeError:
+            # Not a plain configuration (e.g. an already-built CourseGrader), so don't cache it.
+            return grader_from_conf(raw_grader)
+        return _grader_from_json(raw_grader_json)
 
     @property
     def raw_grader(self):  # lint-amnesty, pylint: disable=missing-function-docstring
@@ -1429,9 +1470,40 @@ class CourseBlock(
         """
         Get a list of dicts with start and end fields with datetime values from
         the discussion_blackouts setting
+
+        The parsed list is reused until the discussion_blackouts setting changes,
+        so callers must not modify it.
+        """
+        return self._get_parsed_discussion_blackouts()[0]
+
+    def _get_parsed_discussion_blackouts(self):
         """
+        Return a tuple of the blackout datetimes (as get_discussion_blackout_datetimes),
+        the sorted blackout start datetimes, and for each of those starts the latest end
+        among blackouts starting no later than it.
 
-        blackout_dates = self.discussion_blackouts
+        The discussion_blackouts setting is only parsed again once it has changed.
+        """
+        raw_blackout_dates = self.discussion_blackouts
+        if self._parsed_discussion_blackouts is not None:
+            parsed_from, parsed = self._parsed_discussion_blackouts
+            if parsed_from == raw_blackout_dates:
+                return parsed
+
+        blackout_datetimes = self._parse_discussion_blackouts(raw_blackout_dates)
+        by_start = sorted(blackout_datetimes, key=lambda blackout: blackout["start"])
+        starts = [blackout["start"] for blackout in by_start]
+        latest_ends = list(itertools.accumulate((blackout["end"] for blackout in by_start), max))
+        parsed = (blackout_datetimes, starts, latest_ends)
+        # Keep a copy of what was parsed, since the field value can be mutated in place.
+        self._parsed_discussion_blackouts = (copy.deepcopy(raw_blackout_dates), parsed)
+        return parsed
+
+    def _parse_discussion_blackouts(self, blackout_dates):
+        """
+        Parse a discussion_blackouts setting value into a list of dicts with
+        start and end datetimes, or an empty list if it is malformed.
+        """
         date_proxy = Date()
         if blackout_dates and type(blackout_dates[0]) not in (list, tuple):
             blackout_dates = [blackout_dates]
@@ -1460,12 +1532,11 @@ class CourseBlock(
         Return whether forum posts are allowed by the discussion_blackouts
         setting
         """
-        blackouts = self.get_discussion_blackout_datetimes()
+        _, starts, latest_ends = self._get_parsed_discussion_blackouts()
         now = datetime.now(utc)
-        for blackout in blackouts:
-            if blackout["start"] <= now <= blackout["end"]:
-                return False
-        return True
+        # Only blackouts that have started can be in effect; one is if any of them hasn't ended yet.
+        started = bisect.bisect_right(starts, now)
+        return started == 0 or latest_ends[started - 1] < now
 
     @property
     def number(self):
@@ -8,7 +8,8 @@ classes, which both need these type of functions.
 
 
 from base64 import b32encode
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from math import exp
 
 import dateutil.parser
@@ -177,12 +178,26 @@ def sorting_dates(start, advertised_start, announcement):
     compute the is_new flag and the sorting_score.
     """
     try:
-        start = dateutil.parser.parse(advertised_start)
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=utc)
+        start = _parse_advertised_start(advertised_start, date.today())
     except (TypeError, ValueError, AttributeError):
         start = start  # lint-amnesty, pylint: disable=self-assigning-variable
 
     now = datetime.now(utc)
 
     return announcement, start, now
+
+
+@lru_cache(maxsize=1024)
+def _parse_advertised_start(advertised_start, today):  # pylint: disable=unused-argument
+    """
+    Parse an advertised start date string into a timezone-aware datetime.
+
+    Course listings sort every course by these dates on each render, and
+    there are only a handful of distinct values, so results are memoized.
+    dateutil fills in missing date parts (e.g. for "May 2025") from the
+    current date, so ``today`` is part of the cache key.
+    """
+    start = dateutil.parser.parse(advertised_start)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=utc)
+    return start
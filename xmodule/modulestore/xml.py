@@ -66,9 +66,15 @@ class ImportSystem(XMLParsingSystem, MakoDescriptorSystem):  # lint-amnesty, pyl
         self.modulestore = xmlstore
 
         def process_xml(xml):  # lint-amnesty, pylint: disable=too-many-statements
-            """Takes an xml string, and returns a XBlock created from
-            that xml.
+            """Takes an xml string (or an already-parsed element), and returns
+            a XBlock created from that xml.
             """
+            xml_data = None
+            if etree.iselement(xml):
+                # Don't make the caller serialize an element only for us to parse it again.
+                # The string form is still needed for fallback names and error reporting.
+                xml_data = xml
+                xml = etree.tostring(xml_data, encoding='unicode')
 
             def make_name_unique(xml_data):
                 """
@@ -158,7 +164,8 @@ class ImportSystem(XMLParsingSystem, MakoDescriptorSystem):  # lint-amnesty, pyl
                 xml_data.set('url_name', url_name)
 
             try:
-                xml_data = etree.fromstring(xml)
+                if xml_data is None:
+                    xml_data = etree.fromstring(xml)
                 make_name_unique(xml_data)
                 block = self.xblock_from_node(
                     xml_data,
@@ -457,7 +464,9 @@ class XMLModuleStore(ModuleStoreReadBase):
         returns a CourseBlock for the course
         """
         log.info(f'Course import {target_course_id}: Starting courselike import from {course_dir}')
-        with open(self.data_dir / course_dir / self.parent_xml) as course_file:
+        # Read raw bytes and let lxml decode them (honouring any XML encoding declaration)
+        # rather than decoding the whole file in Python with the locale's default encoding.
+        with open(self.data_dir / course_dir / self.parent_xml, 'rb') as course_file:
             course_data = etree.parse(course_file, parser=edx_xml_parser).getroot()
 
             org = course_data.get('org')
@@ -545,7 +554,7 @@ class XMLModuleStore(ModuleStoreReadBase):
                 services=services,
                 target_course_id=target_course_id,
             )
-            course_block = system.process_xml(etree.tostring(course_data, encoding='unicode'))
+            course_block = system.process_xml(course_data)
             # If we fail to load the course, then skip the rest of the loading steps
             if isinstance(course_block, ErrorBlock):
                 return course_block
@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 import ddt
 from dateutil import parser
 from django.conf import settings
+from edx_django_utils.cache import TieredCache
 from django.test import override_settings
 from fs.memoryfs import MemoryFS
 from opaque_keys.edx.keys import CourseKey
@@ -281,6 +282,58 @@ class IsNewCourseTestCase(unittest.TestCase):
         assert block.is_newish is True
 
 
+class TextbookTestCase(unittest.TestCase):
+    """
+    Tests for fetching and caching a Textbook's table of contents.
+    """
+    TOC_XML = (
+        b'<?xml version="1.0"?><table_of_contents>'
+        b'<entry page="5" page_label="ii" name="Table of Contents"/>'
+        b'<entry page="9" page_label="vi" name="Chapter 1">'
+        b'<entry page="12" page_label="ix" name="Section 1.1"/>'
+        b'</entry>'
+        b'</table_of_contents>'
+    )
+
+    def setUp(self):
+        super().setUp()
+        TieredCache.dangerous_clear_all_tiers()
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+
+    @patch('xmodule.course_block._toc_session.get')
+    def test_table_of_contents_is_fetched_lazily(self, mock_get):
+        mock_get.return_value.content = self.TOC_XML
+
+        textbooks = xmodule.course_block.TextbookList().from_json([('Book', 'https://example.com/book/')])
+        assert textbooks[0].title == 'Book'
+        assert not mock_get.called
+
+        assert textbooks[0].start_page == 5
+        assert mock_get.call_count == 1
+
+    @patch('xmodule.course_block._toc_session.get')
+    def test_table_of_contents_is_cached(self, mock_get):
+        mock_get.return_value.content = self.TOC_XML
+
+        first = xmodule.course_block.Textbook('Book', 'https://example.com/book/')
+        second = xmodule.course_block.Textbook('Book', 'https://example.com/book/')
+        assert first.start_page == second.start_page == 5
+        assert first.end_page == second.end_page == 12
+        mock_get.assert_called_once_with(
+            'https://example.com/book/toc.xml', timeout=xmodule.course_block.TEXTBOOK_TOC_REQUEST_TIMEOUT
+        )
+
+    @patch('xmodule.course_block._toc_session.get')
+    def test_unparseable_table_of_contents_is_not_cached(self, mock_get):
+        mock_get.return_value.content = b'not xml'
+        with pytest.raises(Exception, match='Unable to parse XML'):
+            _ = xmodule.course_block.Textbook('Book', 'https://example.com/book/').table_of_contents
+
+        mock_get.return_value.content = self.TOC_XML
+        assert xmodule.course_block.Textbook('Book', 'https://example.com/book/').start_page == 5
+        assert mock_get.call_count == 2
+
+
 class DiscussionTopicsTestCase(unittest.TestCase):
 
     def test_default_discussion_topics(self):
@@ -494,6 +547,78 @@ class CourseBlockTestCase(unittest.TestCase):
 
         assert self.course.is_enrollment_open() is enrollment_open
 
+    def test_textbooks_and_wiki_from_xml(self):
+        """
+        Test that textbook and wiki tags are read out of the course XML.
+        """
+        course = DummySystem(load_error_blocks=True).process_xml('''
+            <course org="{org}" course="{course}" url_name="test">
+                <textbook title="Book One" book_url="https://example.com/one/"/>
+                <wiki slug="the_wiki"/>
+                <textbook title="Book Two" book_url="https://example.com/two/"/>
+                <chapter url_name="ch" display_name="CH"/>
+            </course>
+        '''.format(org=ORG, course=COURSE))
+
+        assert course.wiki_slug == 'the_wiki'
+        assert [(book.title, book.book_url) for book in course.textbooks] == [
+            ('Book One', 'https://example.com/one/'),
+            ('Book Two', 'https://example.com/two/'),
+        ]
+        assert len(course.children) == 1
+
+    def test_grader_shared_between_identical_policies(self):
+        """
+        Test that CourseBlock.grader reuses one compiled grader for identical grading policies.
+        """
+        other_course = get_dummy_course(start=_LAST_WEEK)
+        assert other_course.grader is self.course.grader
+
+        other_course.raw_grader = [{'type': 'Homework', 'min_count': 1, 'drop_count': 0, 'weight': 1.0}]
+        assert other_course.grader is not self.course.grader
+        assert [category for _, category, _ in other_course.grader.subgraders] == ['Homework']
+
+    def test_default_grader_is_prebuilt(self):
+        """
+        Test that courses on the default grading policy use the grader built at import time.
+        """
+        assert self.course.grader is xmodule.course_block._DEFAULT_GRADER  # pylint: disable=protected-access
+
+    @ddt.data(
+        ([], True),
+        ([(_LAST_WEEK, _TODAY - timedelta(days=1))], True),
+        ([(_LAST_WEEK, _NEXT_WEEK)], False),
+        ([(_TODAY + timedelta(days=1), _NEXT_WEEK)], True),
+        # A long blackout that started earlier still covers now, even though a later one has ended.
+        ([(_LAST_WEEK, _NEXT_WEEK), (_TODAY - timedelta(days=3), _TODAY - timedelta(days=2))], False),
+        ([(_TODAY - timedelta(days=3), _TODAY - timedelta(days=2)), (_LAST_WEEK, _TODAY - timedelta(days=1))], True),
+    )
+    @ddt.unpack
+    def test_forum_posts_allowed(self, blackouts, expected):
+        """
+        Test CourseBlock.forum_posts_allowed.
+        """
+        self.course.discussion_blackouts = [[start.isoformat(), end.isoformat()] for start, end in blackouts]
+        assert self.course.forum_posts_allowed is expected
+
+    def test_discussion_blackout_datetimes_reparsed_on_change(self):
+        """
+        Test that CourseBlock.get_discussion_blackout_datetimes only parses the
+        discussion_blackouts setting again once it has changed.
+        """
+        self.course.discussion_blackouts = [[_LAST_WEEK.isoformat(), _NEXT_WEEK.isoformat()]]
+        with patch.object(
+            self.course, '_parse_discussion_blackouts',
+            wraps=self.course._parse_discussion_blackouts,  # pylint: disable=protected-access
+        ) as mock_parse:
+            blackouts = self.course.get_discussion_blackout_datetimes()
+            assert self.course.get_discussion_blackout_datetimes() is blackouts
+            assert mock_parse.call_count == 1
+
+            self.course.discussion_blackouts = [[_TODAY.isoformat(), _NEXT_WEEK.isoformat()]]
+            assert self.course.get_discussion_blackout_datetimes() == [{'start': _TODAY, 'end': _NEXT_WEEK}]
+            assert mock_parse.call_count == 2
+
 
 @ddt.ddt
 class ProctoringProviderTestCase(unittest.TestCase):
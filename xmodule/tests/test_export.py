@@ -71,7 +71,7 @@ class RoundTripTestCase(unittest.TestCase):
         self.addCleanup(shutil.rmtree, self.temp_dir)
 
     @mock.patch('xmodule.video_block.video_block.edxval_api', None)
-    @mock.patch('xmodule.course_block.requests.get')
+    @mock.patch('xmodule.course_block._toc_session.get')
     @ddt.data(
         "toy",
         "simple",
@@ -86,11 +86,11 @@ class RoundTripTestCase(unittest.TestCase):
     def test_export_roundtrip(self, course_dir, mock_get):
 
         # Patch network calls to retrieve the textbook TOC
-        mock_get.return_value.text = dedent("""
+        mock_get.return_value.content = dedent("""
             <?xml version="1.0"?><table_of_contents>
             <entry page="5" page_label="ii" name="Table of Contents"/>
             </table_of_contents>
-        """).strip()
+        """).strip().encode('utf-8')
 
         root_dir = path(self.temp_dir)
         print(f"Copying test course to temp dir {root_dir}")